@@ -1,12 +1,18 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from datetime import datetime, timedelta
+from starlette.datastructures import Headers
+from cachetools import TTLCache
+import jwt
+from datetime import timedelta
+import hmac
 import os
+import time
 from typing import Optional
 
-# Security scheme
-security = HTTPBearer()
+JWTError = jwt.InvalidTokenError
+
+# Security scheme (documents bearer auth in OpenAPI; AuthMiddleware does the work)
+security = HTTPBearer(auto_error=False)
 
 # Hardcoded users (in production, use proper password hashing)
 ALLOWED_USERS = {"ray": "password123", "dana": "secret"}
@@ -16,45 +22,92 @@ SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-change-me")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# Recently verified tokens: raw token -> (username, exp timestamp)
+_token_cache = TTLCache(maxsize=4096, ttl=60)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expires_in = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expires_in = ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
-    to_encode.update({"exp": expire})
+    # JWT exp is epoch seconds, so skip datetime arithmetic entirely
+    to_encode.update({"exp": int(time.time()) + expires_in})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def verify_user(username: str, password: str) -> bool:
     """Verify username and password against hardcoded users"""
-    return username in ALLOWED_USERS and ALLOWED_USERS[username] == password
+    expected = ALLOWED_USERS.get(username)
+    # Constant-time comparison to avoid leaking password prefixes via timing
+    return expected is not None and hmac.compare_digest(
+        expected.encode(), password.encode()
+    )
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> str:
-    """Extract and verify current user from JWT token"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+def authenticate_token(token: str) -> Optional[str]:
+    """Return the username for a valid JWT, or None"""
+    # Skip signature verification for tokens seen recently, honoring exp
+    cached = _token_cache.get(token)
+    if cached is not None:
+        username, expires_at = cached
+        if expires_at > time.time():
+            return username
+        _token_cache.pop(token, None)
+        return None
 
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
+        return None
+
+    username = payload.get("sub")
+    if not isinstance(username, str) or username not in ALLOWED_USERS:
+        return None
+
+    if "exp" in payload:
+        _token_cache[token] = (username, payload["exp"])
+
+    return username
 
-    if username not in ALLOWED_USERS:
-        raise credentials_exception
+
+class AuthMiddleware:
+    """ASGI middleware that verifies the bearer token once per request
+
+    The authenticated username (or None) is stored on request.state.user.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            username = None
+            authorization = Headers(scope=scope).get("authorization")
+            if authorization:
+                scheme, _, token = authorization.partition(" ")
+                if scheme.lower() == "bearer" and token:
+                    username = authenticate_token(token)
+            scope.setdefault("state", {})["user"] = username
+
+        await self.app(scope, receive, send)
+
+
+async def get_current_user(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+) -> str:
+    """Return the user authenticated by AuthMiddleware"""
+    username = getattr(request.state, "user", None)
+    if username is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     return username
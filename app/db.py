@@ -1,26 +1,120 @@
 from sqlmodel import SQLModel, create_engine, Session
-from contextlib import contextmanager
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 import os
 
-# SQLite database URL
-DATABASE_URL = "sqlite:///./tvtracker.db"
+# SQLite database file, shared by the writer and reader pools
+# (":memory:" keeps everything in a single in-process connection)
+DATABASE_FILE = os.getenv("DATABASE_PATH", "./tvtracker.db")
 
-# Create engine
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}, echo=False
+# SQLite tuning applied to every new writer connection
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "busy_timeout=5000",
+    "cache_size=-20000",
+    "temp_store=memory",
+    "foreign_keys=ON",
 )
 
+# Read-only connections can't switch journal mode (it writes the file header),
+# and synchronous only affects writes
+READ_ONLY_SQLITE_PRAGMAS = tuple(
+    pragma
+    for pragma in SQLITE_PRAGMAS
+    if not pragma.startswith(("journal_mode", "synchronous"))
+)
+
+
+def _sqlite_pragmas(pragmas):
+    """Build a connect listener that applies the given PRAGMAs"""
+
+    def _apply(dbapi_conn, _):
+        cursor = dbapi_conn.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+    return _apply
+
+
+def _create_engine(url: str, pool_size: int, max_overflow: int, pragmas):
+    """Create a pooled SQLite engine with a PRAGMA listener attached"""
+    new_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        echo=False,
+        query_cache_size=1200,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=30,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+    )
+    event.listen(new_engine, "connect", _sqlite_pragmas(pragmas))
+    return new_engine
+
+
+def make_engines(path: str):
+    """Create the (read-write, read-only) engine pair for a SQLite file"""
+    url = f"sqlite:///{path}"
+    if path == ":memory:":
+        # Each in-memory connection is a separate database, so share just one
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            echo=False,
+            query_cache_size=1200,
+            poolclass=StaticPool,
+        )
+        return engine, engine
 
-@contextmanager
-def SessionLocal():
-    """Context manager for database sessions"""
-    session = Session(engine)
-    try:
-        yield session
-    finally:
-        session.close()
+    # SQLite allows a single writer, so writes go through a one-connection pool
+    writer = _create_engine(url, pool_size=1, max_overflow=0, pragmas=SQLITE_PRAGMAS)
+
+    # WAL mode lets readers run concurrently with the writer
+    reader = _create_engine(
+        f"sqlite:///file:{path}?mode=ro&uri=true",
+        pool_size=int(os.getenv("DB_POOL_SIZE", str(os.cpu_count() or 1))),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pragmas=READ_ONLY_SQLITE_PRAGMAS,
+    )
+    return writer, reader
+
+
+engine_rw, engine_ro = make_engines(DATABASE_FILE)
+
+# Session factories (usable as context managers: `with SessionLocal() as session`)
+SessionLocal = sessionmaker(
+    bind=engine_rw, class_=Session, autoflush=False, expire_on_commit=False
+)
+ReadSessionLocal = sessionmaker(
+    bind=engine_ro, class_=Session, autoflush=False, expire_on_commit=False
+)
 
 
 def init_db():
     """Initialize database tables"""
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(engine_rw)
+
+    # create_all skips existing tables, so add the nullable updated_at column
+    # to databases created before it existed
+    from app.models import Show
+
+    column = Show.__table__.c.updated_at
+    with engine_rw.begin() as connection:
+        columns = inspect(connection).get_columns(Show.__tablename__)
+        existing = {existing_column["name"] for existing_column in columns}
+        if column.name not in existing:
+            column_type = column.type.compile(engine_rw.dialect)
+            connection.exec_driver_sql(
+                f'ALTER TABLE "{Show.__tablename__}" ADD COLUMN "{column.name}" '
+                f"{column_type}"
+            )
+
+    # Likewise for indexes added to existing tables
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine_rw, checkfirst=True)
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from fastapi import Depends
+from sqlmodel import Session
+from app.db import SessionLocal, ReadSessionLocal
+from app.auth import get_current_user
+
+
+def get_session():
+    """Dependency to get database session"""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_session():
+    """Dependency to get a read-only database session"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@dataclass(slots=True)
+class Ctx:
+    """Database session and authenticated user for a request"""
+
+    session: Session
+    user: str
+
+
+async def get_ctx(
+    session: Session = Depends(get_session),
+    user: str = Depends(get_current_user),
+) -> Ctx:
+    """Dependency for endpoints that write to the database"""
+    return Ctx(session, user)
+
+
+async def get_read_ctx(
+    session: Session = Depends(get_read_session),
+    user: str = Depends(get_current_user),
+) -> Ctx:
+    """Dependency for read-only endpoints"""
+    return Ctx(session, user)
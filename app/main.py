@@ -1,8 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.db import init_db
+from app.db import init_db, DATABASE_FILE
 from app.routers import shows, users
-from app.auth import verify_user, create_access_token
+from app.auth import verify_user, create_access_token, AuthMiddleware
 from app.schemas import UserLogin, Token
 from app.utils import should_seed_data, seed_demo_data
 import os
@@ -17,16 +17,16 @@ app = FastAPI(
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",  # Vite default
-        "http://localhost:3000",  # React default
-        "*",  # Allow all in development
-    ],
-    allow_credentials=True,
+    allow_origins=["*"],  # Allow all origins (covers Vite/React dev servers)
+    allow_credentials=False,  # Bearer tokens, not cookies; lets "*" be sent as-is
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "ETag"],  # List pagination and caching
 )
 
+# Verify bearer tokens once per request, ahead of dependency resolution
+app.add_middleware(AuthMiddleware)
+
 # Include routers
 app.include_router(shows.router, prefix="/shows", tags=["shows"])
 app.include_router(users.router, prefix="/users", tags=["users"])
@@ -59,18 +59,37 @@ async def root():
     return {"message": "TV Show Tracker API", "docs": "/docs", "users": ["ray", "dana"]}
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database and seed data on startup"""
+def prepare_database():
+    """Create tables and seed demo data if enabled"""
+    # Check before init_db creates the database file
+    fresh_db = not os.path.exists(DATABASE_FILE)
+
     # Initialize database
     init_db()
 
     # Seed demo data if enabled
     if should_seed_data():
-        seed_demo_data()
+        seed_demo_data(fresh_db)
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Initialize database and seed data on startup"""
+    # Skipped when the parent process already did it before forking workers
+    if os.getenv("TVTRACKER_DB_PREPARED") != "true":
+        prepare_database()
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # One worker by default: each process has its own single-writer pool
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    if workers > 1:
+        # Prepare the database once so workers don't race on create_all
+        prepare_database()
+        os.environ["TVTRACKER_DB_PREPARED"] = "true"
+
+    # loop/http default to "auto", which picks uvloop and httptools when
+    # installed (uvicorn[standard], not on Windows); workers need an import string
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, workers=workers)
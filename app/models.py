@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, Field
-from datetime import datetime
+from datetime import datetime, UTC
 from typing import Optional
 
 
@@ -8,10 +8,13 @@ class Show(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(unique=True, index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    watched: bool = Field(default=False)  # Global watch status
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    watched: bool = Field(default=False, index=True)  # Global watch status
     rating: Optional[int] = Field(default=None, ge=1, le=5)  # Global rating
     watched_at: Optional[datetime] = Field(default=None)  # When it was watched
+    updated_at: Optional[datetime] = Field(
+        default_factory=lambda: datetime.now(UTC), index=True
+    )  # Last change, used for list ETags
 
 
 # Watch model removed - no longer needed for per-user tracking
@@ -1,58 +1,69 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlmodel import select, func
+from sqlalchemy import bindparam, delete
 from typing import List, Optional
-from app.db import SessionLocal
+from app.deps import Ctx, get_ctx, get_read_ctx
 from app.models import Show
+from app.utils import show_list_response
 from app.schemas import ShowCreate, ShowUpdate, ShowResponse, WatchCreate
-from app.auth import get_current_user
-from datetime import datetime
+from datetime import datetime, UTC
+import hashlib
 
 router = APIRouter()
 
+# Statements built once at import and reused with bound parameters
+_SEL_BY_TITLE = select(Show).where(Show.title == bindparam("title"))
 
-def get_session():
-    """Dependency to get database session"""
-    with SessionLocal() as session:
-        yield session
+# Cheap fingerprint of the shows table, used for the list ETag: deletes change
+# the count, every other write bumps updated_at
+_SEL_FINGERPRINT = select(func.count(Show.id), func.max(Show.updated_at))
 
 
 @router.get("/", response_model=List[ShowResponse])
-async def list_shows(
+def list_shows(
+    request: Request,
     watched: Optional[bool] = Query(None, description="Filter by watched status"),
-    session: Session = Depends(get_session),
-    current_user: str = Depends(get_current_user),
+    limit: int = Query(100, ge=1, le=500, description="Maximum shows to return"),
+    offset: int = Query(0, ge=0, description="Number of shows to skip"),
+    ctx: Ctx = Depends(get_read_ctx),
 ):
-    """List all shows with optional watched filter"""
+    """List shows with optional watched filter, one page at a time"""
+    # Answer unchanged polls with 304 before loading any rows
+    fingerprint = ctx.session.exec(_SEL_FINGERPRINT).one()
+    key = repr((tuple(fingerprint), watched, limit, offset)).encode()
+    etag = f'W/"{hashlib.sha1(key).hexdigest()[:16]}"'
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    statement = select(Show)
+    count_statement = select(func.count()).select_from(Show)
     if watched is not None:
         # Filter by global watched status
-        shows = session.exec(select(Show).where(Show.watched == watched)).all()
-    else:
-        # Return all shows
-        shows = session.exec(select(Show)).all()
-
-    return [
-        ShowResponse(
-            id=show.id,
-            title=show.title,
-            created_at=show.created_at,
-            watched=show.watched,
-            rating=show.rating,
-            watched_at=show.watched_at,
-        )
-        for show in shows
-    ]
+        statement = statement.where(Show.watched == watched)
+        count_statement = count_statement.where(Show.watched == watched)
+
+    total = ctx.session.exec(count_statement).one()
+    shows = ctx.session.exec(
+        statement.order_by(Show.id).limit(limit).offset(offset)
+    ).all()
+
+    response = show_list_response(shows, total)
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.post("/", response_model=ShowResponse, status_code=status.HTTP_201_CREATED)
-async def create_show(
+def create_show(
     show_data: ShowCreate,
-    session: Session = Depends(get_session),
-    current_user: str = Depends(get_current_user),
+    ctx: Ctx = Depends(get_ctx),
 ):
     """Create a new TV show"""
     # Check for duplicate title
-    existing_show = session.exec(
-        select(Show).where(Show.title == show_data.title)
+    existing_show = ctx.session.exec(
+        _SEL_BY_TITLE, params={"title": show_data.title}
     ).first()
 
     if existing_show:
@@ -62,9 +73,9 @@ async def create_show(
         )
 
     show = Show(title=show_data.title)
-    session.add(show)
-    session.commit()
-    session.refresh(show)
+    ctx.session.add(show)
+    ctx.session.commit()
+    ctx.session.refresh(show)
 
     return ShowResponse(
         id=show.id,
@@ -77,14 +88,13 @@ async def create_show(
 
 
 @router.patch("/{show_id}", response_model=ShowResponse)
-async def update_show(
+def update_show(
     show_id: int,
     show_data: ShowUpdate,
-    session: Session = Depends(get_session),
-    current_user: str = Depends(get_current_user),
+    ctx: Ctx = Depends(get_ctx),
 ):
     """Update a TV show"""
-    show = session.exec(select(Show).where(Show.id == show_id)).first()
+    show = ctx.session.get(Show, show_id)
     if not show:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Show not found"
@@ -92,8 +102,8 @@ async def update_show(
 
     # Check for duplicate title if updating title
     if show_data.title and show_data.title != show.title:
-        existing_show = session.exec(
-            select(Show).where(Show.title == show_data.title)
+        existing_show = ctx.session.exec(
+            _SEL_BY_TITLE, params={"title": show_data.title}
         ).first()
 
         if existing_show:
@@ -105,10 +115,11 @@ async def update_show(
     # Update fields
     if show_data.title is not None:
         show.title = show_data.title
+    show.updated_at = datetime.now(UTC)
 
-    session.add(show)
-    session.commit()
-    session.refresh(show)
+    ctx.session.add(show)
+    ctx.session.commit()
+    ctx.session.refresh(show)
 
     return ShowResponse(
         id=show.id,
@@ -121,28 +132,26 @@ async def update_show(
 
 
 @router.delete("/{show_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_show(
+def delete_show(
     show_id: int,
-    session: Session = Depends(get_session),
-    current_user: str = Depends(get_current_user),
+    ctx: Ctx = Depends(get_ctx),
 ):
     """Delete a TV show"""
-    show = session.exec(select(Show).where(Show.id == show_id)).first()
-    if not show:
+    # Single DELETE statement; no need to load the row first
+    result = ctx.session.execute(delete(Show).where(Show.id == show_id))
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Show not found"
         )
 
-    session.delete(show)
-    session.commit()
+    ctx.session.commit()
 
 
 @router.post("/{show_id}/watch", status_code=status.HTTP_201_CREATED)
-async def watch_show(
+def watch_show(
     show_id: int,
     watch_data: WatchCreate,
-    session: Session = Depends(get_session),
-    current_user: str = Depends(get_current_user),
+    ctx: Ctx = Depends(get_ctx),
 ):
     """Mark a show as globally watched with rating"""
     # Validate rating
@@ -153,7 +162,7 @@ async def watch_show(
         )
 
     # Check if show exists
-    show = session.exec(select(Show).where(Show.id == show_id)).first()
+    show = ctx.session.get(Show, show_id)
     if not show:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Show not found"
@@ -162,23 +171,23 @@ async def watch_show(
     # Update global watch status
     show.watched = True
     show.rating = watch_data.rating
-    show.watched_at = datetime.utcnow()
+    show.watched_at = datetime.now(UTC)
+    show.updated_at = show.watched_at
 
-    session.add(show)
-    session.commit()
+    ctx.session.add(show)
+    ctx.session.commit()
 
     return {"message": "Show marked as globally watched"}
 
 
 @router.delete("/{show_id}/watch", status_code=status.HTTP_204_NO_CONTENT)
-async def unwatch_show(
+def unwatch_show(
     show_id: int,
-    session: Session = Depends(get_session),
-    current_user: str = Depends(get_current_user),
+    ctx: Ctx = Depends(get_ctx),
 ):
     """Mark a show as globally unwatched"""
     # Check if show exists
-    show = session.exec(select(Show).where(Show.id == show_id)).first()
+    show = ctx.session.get(Show, show_id)
     if not show:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Show not found"
@@ -188,6 +197,7 @@ async def unwatch_show(
     show.watched = False
     show.rating = None
     show.watched_at = None
+    show.updated_at = datetime.now(UTC)
 
-    session.add(show)
-    session.commit()
+    ctx.session.add(show)
+    ctx.session.commit()
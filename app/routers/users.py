@@ -1,25 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlmodel import select, func
 from typing import List
-from app.db import SessionLocal
+from app.deps import Ctx, get_read_ctx
 from app.models import Show
+from app.utils import show_list_response
 from app.schemas import ShowResponse
-from app.auth import get_current_user
 
 router = APIRouter()
 
 
-def get_session():
-    """Dependency to get database session"""
-    with SessionLocal() as session:
-        yield session
-
-
 @router.get("/{username}/watched", response_model=List[ShowResponse])
-async def get_user_watched_shows(
+def get_user_watched_shows(
     username: str,
-    session: Session = Depends(get_session),
-    current_user: str = Depends(get_current_user),
+    limit: int = Query(100, ge=1, le=500, description="Maximum shows to return"),
+    offset: int = Query(0, ge=0, description="Number of shows to skip"),
+    ctx: Ctx = Depends(get_read_ctx),
 ):
     """Get globally watched shows (same for all users now)"""
     # Check if user exists (simple check against allowed users)
@@ -30,27 +25,26 @@ async def get_user_watched_shows(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    # Get all globally watched shows
-    watched_shows = session.exec(select(Show).where(Show.watched == True)).all()
+    # Get one page of globally watched shows
+    count_statement = select(func.count()).select_from(Show)
+    total = ctx.session.exec(count_statement.where(Show.watched == True)).one()
+    watched_shows = ctx.session.exec(
+        select(Show)
+        .where(Show.watched == True)
+        .order_by(Show.id)
+        .limit(limit)
+        .offset(offset)
+    ).all()
 
-    return [
-        ShowResponse(
-            id=show.id,
-            title=show.title,
-            created_at=show.created_at,
-            watched=show.watched,
-            rating=show.rating,
-            watched_at=show.watched_at,
-        )
-        for show in watched_shows
-    ]
+    return show_list_response(watched_shows, total)
 
 
 @router.get("/{username}/unwatched", response_model=List[ShowResponse])
-async def get_user_unwatched_shows(
+def get_user_unwatched_shows(
     username: str,
-    session: Session = Depends(get_session),
-    current_user: str = Depends(get_current_user),
+    limit: int = Query(100, ge=1, le=500, description="Maximum shows to return"),
+    offset: int = Query(0, ge=0, description="Number of shows to skip"),
+    ctx: Ctx = Depends(get_read_ctx),
 ):
     """Get globally unwatched shows (same for all users now)"""
     # Check if user exists (simple check against allowed users)
@@ -61,17 +55,15 @@ async def get_user_unwatched_shows(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    # Get all globally unwatched shows
-    unwatched_shows = session.exec(select(Show).where(Show.watched == False)).all()
+    # Get one page of globally unwatched shows
+    count_statement = select(func.count()).select_from(Show)
+    total = ctx.session.exec(count_statement.where(Show.watched == False)).one()
+    unwatched_shows = ctx.session.exec(
+        select(Show)
+        .where(Show.watched == False)
+        .order_by(Show.id)
+        .limit(limit)
+        .offset(offset)
+    ).all()
 
-    return [
-        ShowResponse(
-            id=show.id,
-            title=show.title,
-            created_at=show.created_at,
-            watched=show.watched,
-            rating=show.rating,
-            watched_at=show.watched_at,
-        )
-        for show in unwatched_shows
-    ]
+    return show_list_response(unwatched_shows, total)
@@ -1,28 +1,41 @@
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.models import Show
+from app.schemas import ShowResponse
 from app.db import SessionLocal
+from typing import List
 import os
 
+# Demo TV shows inserted when SEED=true
+DEMO_SHOW_TITLES = [
+    "Breaking Bad",
+    "The Wire",
+    "Mad Men",
+    "The Sopranos",
+    "Game of Thrones",
+]
 
-def seed_demo_data():
-    """Seed database with demo TV shows"""
+
+def seed_demo_data(fresh_db: bool = False):
+    """Seed database with demo TV shows
+
+    Pass fresh_db=True when the database file was just created to skip the
+    existing-data check.
+    """
     with SessionLocal() as session:
         # Check if data already exists
-        existing_shows = session.query(Show).count()
-        if existing_shows > 0:
-            return  # Already seeded
-
-        # Create demo shows
-        demo_shows = [
-            Show(title="Breaking Bad"),
-            Show(title="The Wire"),
-            Show(title="Mad Men"),
-            Show(title="The Sopranos"),
-            Show(title="Game of Thrones"),
-        ]
-
-        for show in demo_shows:
-            session.add(show)
+        if not fresh_db:
+            existing_shows = session.query(Show).count()
+            if existing_shows > 0:
+                return  # Already seeded
 
+        # Insert all demo shows with one executemany INSERT; titles already
+        # present (e.g. seeded by another process) are skipped
+        session.execute(
+            sqlite_insert(Show.__table__).on_conflict_do_nothing(),
+            [{"title": title} for title in DEMO_SHOW_TITLES],
+        )
         session.commit()
         print("Demo data seeded successfully!")
 
@@ -30,3 +43,33 @@ def seed_demo_data():
 def should_seed_data() -> bool:
     """Check if demo data should be seeded based on environment variable"""
     return os.getenv("SEED", "false").lower() == "true"
+
+
+# Serializes ShowResponse lists straight to JSON bytes in pydantic-core
+_show_list_adapter = TypeAdapter(List[ShowResponse])
+
+
+def show_list_response(shows: List[Show], total: int) -> Response:
+    """Render a page of shows as a JSON response with an X-Total-Count header
+
+    Rows come straight from the ORM, so Pydantic validation is skipped and
+    the returned Response bypasses FastAPI's response_model re-validation.
+    """
+    content = _show_list_adapter.dump_json(
+        [
+            ShowResponse.model_construct(
+                id=show.id,
+                title=show.title,
+                created_at=show.created_at,
+                watched=show.watched,
+                rating=show.rating,
+                watched_at=show.watched_at,
+            )
+            for show in shows
+        ]
+    )
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"X-Total-Count": str(total)},
+    )
@@ -0,0 +1,172 @@
+import os
+
+# Keep the app's own engine off disk; must be set before app.db is imported
+os.environ["DATABASE_PATH"] = ":memory:"
+
+import pytest
+import pytest_asyncio
+import threading
+from functools import lru_cache
+from uuid import uuid4
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+from app.main import app
+from app.models import Show
+from app.deps import get_session, get_read_session
+
+
+@pytest.fixture(scope="session", autouse=True)
+def engine():
+    """In-memory database shared by every test, with tables created once"""
+    test_engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+    @event.listens_for(test_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, _):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(test_engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    SQLModel.metadata.create_all(test_engine)
+    yield test_engine
+    test_engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def _reset_overrides():
+    """Restore app.dependency_overrides so overrides never leak between tests"""
+    saved = dict(app.dependency_overrides)
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(saved)
+
+
+@pytest.fixture(autouse=True)
+def db_session(engine):
+    """Run each test inside a transaction that is rolled back afterwards
+
+    Commits made by the endpoints only release a SAVEPOINT, so every test
+    starts from the same empty tables.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    lock = threading.Lock()
+
+    def _get_test_session():
+        # Sync endpoints run in the threadpool; never share the Session concurrently
+        with lock:
+            yield session
+
+    app.dependency_overrides[get_session] = _get_test_session
+    app.dependency_overrides[get_read_session] = _get_test_session
+
+    yield session
+
+    app.dependency_overrides.pop(get_session, None)
+    app.dependency_overrides.pop(get_read_session, None)
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client whose startup/shutdown handlers run once per session"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Pin anyio to asyncio so trio is never probed"""
+    return "asyncio"
+
+
+@pytest_asyncio.fixture(scope="session")
+async def aclient():
+    """Async client for issuing concurrent requests against the app"""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def login(client):
+    """Return the access token for a user, logging in once per credentials"""
+
+    @lru_cache(maxsize=32)
+    def _login(username, password):
+        response = client.post(
+            "/auth/login", json={"username": username, "password": password}
+        )
+        return response.json()["access_token"]
+
+    return _login
+
+
+@pytest.fixture(scope="session")
+def auth_token(login):
+    """Access token for the shared test user"""
+    return login("ray", "password123")
+
+
+@pytest.fixture(scope="session")
+def auth_headers(auth_token):
+    """Authorization headers for the shared test user"""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture(scope="session")
+def auth_headers_factory(login):
+    """Build authorization headers for any user, reusing cached tokens"""
+
+    def _headers(username="ray", password="password123"):
+        return {"Authorization": f"Bearer {login(username, password)}"}
+
+    return _headers
+
+
+@pytest.fixture
+def unique_title():
+    """Show title that cannot collide with other tests"""
+    return f"Show-{uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def created_show(client, auth_headers, unique_title):
+    """Create a show and return its id"""
+    response = client.post(
+        "/shows/", json={"title": unique_title}, headers=auth_headers
+    )
+    return response.json()["id"]
+
+
+@pytest.fixture
+def seeded_shows(db_session):
+    """Insert shows directly through the ORM session in one commit"""
+
+    def _seed(n=100):
+        prefix = uuid4().hex[:8]
+        rows = [Show(title=f"{prefix}-{i}") for i in range(n)]
+        db_session.add_all(rows)
+        db_session.commit()
+        return rows
+
+    return _seed
@@ -1,10 +1,11 @@
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
+import time
+import jwt
+from datetime import timedelta
+from app import auth
+from app.auth import create_access_token
 
-client = TestClient(app)
-
-def test_login_success():
+def test_login_success(client):
     """Test successful login"""
     response = client.post("/auth/login", json={
         "username": "ray",
@@ -16,7 +17,7 @@ def test_login_success():
     assert data["token_type"] == "bearer"
     assert data["user"] == "ray"
 
-def test_login_failure():
+def test_login_failure(client):
     """Test failed login"""
     response = client.post("/auth/login", json={
         "username": "ray",
@@ -24,7 +25,7 @@ def test_login_failure():
     })
     assert response.status_code == 401
 
-def test_login_invalid_user():
+def test_login_invalid_user(client):
     """Test login with non-existent user"""
     response = client.post("/auth/login", json={
         "username": "nonexistent",
@@ -32,7 +33,7 @@ def test_login_invalid_user():
     })
     assert response.status_code == 401
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint"""
     response = client.get("/")
     assert response.status_code == 200
@@ -40,3 +41,54 @@ def test_root_endpoint():
     assert data["message"] == "TV Show Tracker API"
     assert "ray" in data["users"]
     assert "dana" in data["users"]
+
+def test_missing_authorization_header(client):
+    """Test protected endpoint without Authorization header"""
+    response = client.get("/shows/")
+    assert response.status_code == 401
+
+@pytest.mark.parametrize("authorization", [
+    "Bearer",
+    "Bearer ",
+    "not-a-scheme",
+    "Basic cmF5OnBhc3N3b3JkMTIz",
+    "Bearer not.a.jwt",
+])
+def test_malformed_authorization_header(client, authorization):
+    """Test protected endpoint with malformed or non-Bearer credentials"""
+    response = client.get("/shows/", headers={"Authorization": authorization})
+    assert response.status_code == 401
+
+def test_bad_signature(client):
+    """Test token signed with a different secret"""
+    token = jwt.encode(
+        {"sub": "ray", "exp": int(time.time()) + 60},
+        "some-other-secret-that-is-long-enough",
+        algorithm=auth.ALGORITHM,
+    )
+    response = client.get("/shows/", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert token not in auth._token_cache
+
+def test_expired_token(client):
+    """Test expired token that has to be decoded"""
+    token = create_access_token({"sub": "ray"}, expires_delta=timedelta(seconds=-10))
+    response = client.get("/shows/", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert token not in auth._token_cache
+
+def test_expired_cached_token(client):
+    """Test token that expires while held in the verified-token cache"""
+    token = create_access_token({"sub": "ray"}, expires_delta=timedelta(minutes=5))
+    headers = {"Authorization": f"Bearer {token}"}
+    try:
+        assert client.get("/shows/", headers=headers).status_code == 200
+        assert token in auth._token_cache
+
+        # Simulate the exp passing while the cache entry is still live
+        auth._token_cache[token] = ("ray", time.time() - 1)
+        response = client.get("/shows/", headers=headers)
+        assert response.status_code == 401
+        assert token not in auth._token_cache
+    finally:
+        auth._token_cache.pop(token, None)
@@ -0,0 +1,78 @@
+import sqlite3
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+from sqlmodel import SQLModel, Session, select
+from app.db import make_engines
+from app.models import Show
+
+
+@pytest.fixture
+def file_engines(tmp_path):
+    """Writer/reader engine pair for a throwaway on-disk database"""
+    engine_rw, engine_ro = make_engines(str(tmp_path / "tvtracker.db"))
+    SQLModel.metadata.create_all(engine_rw)
+    yield engine_rw, engine_ro
+    engine_ro.dispose()
+    engine_rw.dispose()
+
+
+def test_file_database_uses_separate_pools(file_engines):
+    """Test that writes go through a one-connection pool apart from readers"""
+    engine_rw, engine_ro = file_engines
+    assert engine_rw is not engine_ro
+    assert isinstance(engine_rw.pool, QueuePool)
+    assert isinstance(engine_ro.pool, QueuePool)
+    assert engine_rw.pool.size() == 1
+
+
+def test_pragmas_applied(file_engines):
+    """Test that the writer switches to WAL and both engines get the PRAGMAs"""
+    engine_rw, engine_ro = file_engines
+    with engine_rw.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+
+    for engine in file_engines:
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert connection.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+
+
+def test_reader_opens_non_wal_database(tmp_path):
+    """Test that the read-only engine connects to a rollback-journal file"""
+    path = tmp_path / "legacy.db"
+    legacy = sqlite3.connect(path)
+    legacy.execute("CREATE TABLE legacy (id INTEGER PRIMARY KEY)")
+    legacy.commit()
+    legacy.close()
+
+    engine_rw, engine_ro = make_engines(str(path))
+    try:
+        with engine_ro.connect() as connection:
+            journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+            assert journal_mode == "delete"
+            count = connection.exec_driver_sql("SELECT count(*) FROM legacy").scalar()
+            assert count == 0
+    finally:
+        engine_ro.dispose()
+        engine_rw.dispose()
+
+
+def test_writes_visible_to_read_only_session(file_engines):
+    """Test that a committed write is seen through the read-only pool"""
+    engine_rw, engine_ro = file_engines
+    with Session(engine_rw) as session:
+        session.add(Show(title="Shared Show"))
+        session.commit()
+
+    with Session(engine_ro) as session:
+        assert session.exec(select(Show.title)).all() == ["Shared Show"]
+
+
+def test_read_only_session_rejects_writes(file_engines):
+    """Test that the reader URL really opens the database read-only"""
+    _, engine_ro = file_engines
+    with Session(engine_ro) as session:
+        session.add(Show(title="Not Allowed"))
+        with pytest.raises(OperationalError):
+            session.commit()
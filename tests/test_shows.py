@@ -1,85 +1,137 @@
+import asyncio
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
+from uuid import uuid4
 
-client = TestClient(app)
 
-
-def get_auth_token():
-    """Get authentication token for testing"""
+def test_create_show(client, auth_headers, unique_title):
+    """Test creating a show"""
     response = client.post(
-        "/auth/login", json={"username": "ray", "password": "password123"}
+        "/shows/", json={"title": unique_title}, headers=auth_headers
     )
-    return response.json()["access_token"]
-
-
-def test_create_show():
-    """Test creating a show"""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-
-    response = client.post("/shows/", json={"title": "Test Show"}, headers=headers)
     assert response.status_code == 201
     data = response.json()
-    assert data["title"] == "Test Show"
+    assert data["title"] == unique_title
     assert "id" in data
 
 
-def test_create_duplicate_show():
+def test_create_duplicate_show(client, auth_headers, unique_title):
     """Test creating a show with duplicate title"""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
-
     # Create first show
-    client.post("/shows/", json={"title": "Duplicate Show"}, headers=headers)
+    client.post("/shows/", json={"title": unique_title}, headers=auth_headers)
 
     # Try to create duplicate
-    response = client.post("/shows/", json={"title": "Duplicate Show"}, headers=headers)
+    response = client.post(
+        "/shows/", json={"title": unique_title}, headers=auth_headers
+    )
     assert response.status_code == 400
 
 
-def test_list_shows():
-    """Test listing shows"""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
+async def test_bulk_create(aclient, auth_headers):
+    """Test creating several shows concurrently"""
+    titles = [f"Bulk-{uuid4().hex[:8]}" for _ in range(5)]
 
-    response = client.get("/shows/", headers=headers)
+    responses = await asyncio.gather(
+        *[
+            aclient.post("/shows/", json={"title": title}, headers=auth_headers)
+            for title in titles
+        ]
+    )
+    assert [r.status_code for r in responses] == [201] * len(titles)
+    assert sorted(r.json()["title"] for r in responses) == sorted(titles)
+
+
+def test_list_shows(client, auth_headers):
+    """Test listing shows"""
+    response = client.get("/shows/", headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
 
 
-def test_watch_show():
-    """Test marking a show as watched"""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
+def test_list_shows_pagination(client, auth_headers, seeded_shows):
+    """Test that list results are limited and report the total count"""
+    shows = seeded_shows(100)
+
+    response = client.get("/shows/?limit=50&offset=25", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "100"
+    data = response.json()
+    assert len(data) == 50
+    assert data[0]["id"] == shows[25].id
+
 
-    # First create a show
-    show_response = client.post(
-        "/shows/", json={"title": "Show to Watch"}, headers=headers
+def test_list_shows_not_modified(client, auth_headers, created_show):
+    """Test that a matching If-None-Match returns 304 without a body"""
+    etag = client.get("/shows/", headers=auth_headers).headers["ETag"]
+
+    response = client.get("/shows/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_list_shows_etag_changes_after_update(
+    client, auth_headers, created_show, unique_title
+):
+    """Test that renaming a show invalidates the previous list ETag"""
+    etag = client.get("/shows/", headers=auth_headers).headers["ETag"]
+
+    client.patch(
+        f"/shows/{created_show}",
+        json={"title": f"{unique_title}-renamed"},
+        headers=auth_headers,
     )
-    show_id = show_response.json()["id"]
 
-    # Mark as watched
+    response = client.get("/shows/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert f"{unique_title}-renamed" in [show["title"] for show in response.json()]
+
+
+@pytest.mark.parametrize(
+    "rating,expected_status",
+    [(5, 201), (1, 201), (0, 400), (6, 400), (-1, 400), ("abc", 422)],
+)
+def test_watch_show_rating(client, auth_headers, created_show, rating, expected_status):
+    """Test marking a show as watched with valid and invalid ratings"""
     response = client.post(
-        f"/shows/{show_id}/watch", json={"rating": 5}, headers=headers
+        f"/shows/{created_show}/watch", json={"rating": rating}, headers=auth_headers
     )
-    assert response.status_code == 201
+    assert response.status_code == expected_status
 
 
-def test_watch_show_invalid_rating():
-    """Test watching a show with invalid rating"""
-    token = get_auth_token()
-    headers = {"Authorization": f"Bearer {token}"}
+def test_shows_visible_to_other_users(client, auth_headers_factory, created_show):
+    """Test that shows created by one user are listed for another"""
+    headers = auth_headers_factory("dana", "secret")
 
-    # Create a show
-    show_response = client.post(
-        "/shows/", json={"title": "Show for Rating Test"}, headers=headers
-    )
-    show_id = show_response.json()["id"]
+    response = client.get("/shows/", headers=headers)
+    assert response.status_code == 200
+    assert created_show in [show["id"] for show in response.json()]
 
-    # Try invalid rating
-    response = client.post(
-        f"/shows/{show_id}/watch", json={"rating": 6}, headers=headers
+
+def test_delete_show(client, auth_headers, created_show):
+    """Test deleting a show removes it and a second delete returns 404"""
+    response = client.delete(f"/shows/{created_show}", headers=auth_headers)
+    assert response.status_code == 204
+
+    response = client.delete(f"/shows/{created_show}", headers=auth_headers)
+    assert response.status_code == 404
+
+    response = client.get("/shows/", headers=auth_headers)
+    assert created_show not in [show["id"] for show in response.json()]
+
+
+@pytest.mark.parametrize(
+    "method,path,body",
+    [
+        ("PATCH", "/shows/{id}", {"title": "Missing"}),
+        ("POST", "/shows/{id}/watch", {"rating": 5}),
+        ("DELETE", "/shows/{id}/watch", None),
+    ],
+)
+def test_missing_show_returns_404(client, auth_headers, method, path, body):
+    """Test that show updates report 404 for an unknown id"""
+    response = client.request(
+        method, path.format(id=999999), json=body, headers=auth_headers
     )
-    assert response.status_code == 400
+    assert response.status_code == 404
@@ -0,0 +1,18 @@
+def test_user_show_lists_paginated(client, auth_headers, db_session, seeded_shows):
+    """Test that watched and unwatched lists are paged and report the total"""
+    shows = seeded_shows(100)
+    for show in shows[::3]:
+        show.watched = True
+    db_session.commit()
+    watched = [show for show in shows if show.watched]
+    unwatched = [show for show in shows if not show.watched]
+
+    for path, expected in (("watched", watched), ("unwatched", unwatched)):
+        response = client.get(
+            f"/users/ray/{path}?limit=10&offset=5", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.headers["X-Total-Count"] == str(len(expected))
+        data = response.json()
+        assert len(data) == 10
+        assert data[0]["id"] == expected[5].id